@@ -2,6 +2,12 @@
 
 __version__ = "0.1.0"
 
-from agentbox.runtime import AgentRuntime
-
 __all__ = ["AgentRuntime"]
+
+
+def __getattr__(name):
+    # Imported on first access so entry points like the CLI don't pull in the model/HTTP stack up front
+    if name == "AgentRuntime":
+        from agentbox.runtime import AgentRuntime
+        return AgentRuntime
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
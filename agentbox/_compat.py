@@ -0,0 +1,34 @@
+"""Compatibility helpers for the Python versions and optional dependencies AgentBox supports."""
+
+import json
+import sys
+from typing import Any, Callable, Optional
+
+# dataclass(slots=True) needs Python 3.10+; older versions fall back to a regular __dict__
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _json_dumps(obj: Any, sort_keys: bool, default: Optional[Callable[[Any], Any]]) -> bytes:
+    # Compact and non-ASCII-escaping to match orjson
+    text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys, default=default)
+    try:
+        return text.encode("utf-8")
+    except UnicodeEncodeError:
+        # Lone surrogates can't be encoded raw; escaped, they stay valid JSON
+        return json.dumps(obj, separators=(",", ":"), sort_keys=sort_keys, default=default).encode("ascii")
+
+
+try:
+    import orjson
+    
+    def dumps(obj: Any, *, sort_keys: bool = False, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        """Serialize to compact UTF-8 JSON, with orjson when it accepts the value."""
+        try:
+            return orjson.dumps(obj, default=default, option=orjson.OPT_SORT_KEYS if sort_keys else None)
+        except TypeError:
+            # orjson rejects some values json accepts, e.g. integers beyond 64 bits
+            return _json_dumps(obj, sort_keys, default)
+except ImportError:
+    def dumps(obj: Any, *, sort_keys: bool = False, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        """Serialize to compact UTF-8 JSON."""
+        return _json_dumps(obj, sort_keys, default)
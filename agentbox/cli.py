@@ -3,14 +3,6 @@
 import argparse
 import sys
 
-from agentbox import AgentRuntime
-from agentbox.logger import AuditLogger
-from agentbox.model.openai_client import OpenAIClient
-from agentbox.policy import Policy
-from agentbox.runtime import BudgetExceededError, MaxIterationsError
-from agentbox.tools.filesystem import ReadFileTool
-from agentbox.tools.web import WebRequestTool
-
 
 def main():
     """CLI entrypoint for AgentBox."""
@@ -31,6 +23,7 @@ Examples:
   agentbox run --prompt "Research the API" --policy examples/policies/restricted.yaml
   agentbox run --prompt "Fetch data" --policy policy.yaml --log audit.jsonl
   agentbox run --prompt "Task" --policy policy.yaml --model gpt-4o
+  agentbox run --prompt "Task" --policy policy.yaml --cache .agentbox-cache
         """
     )
     
@@ -57,6 +50,11 @@ Examples:
         help="OpenAI model to use (default: gpt-4o-mini)"
     )
     
+    run_parser.add_argument(
+        "--cache",
+        help="Path to on-disk model response cache (disabled by default)"
+    )
+    
     run_parser.add_argument(
         "--max-iterations",
         type=int,
@@ -71,13 +69,33 @@ Examples:
         parser.print_help()
         sys.exit(1)
     
+    # Deferred until arguments are valid so --help and usage errors stay fast
+    try:
+        from agentbox.logger import AuditLogger
+        from agentbox.model.cache import ShelveChatCache
+        from agentbox.model.openai_client import OpenAIClient
+        from agentbox.policy import Policy
+        from agentbox.runtime import AgentRuntime, BudgetExceededError, MaxIterationsError
+        from agentbox.tools.filesystem import ReadFileTool
+        from agentbox.tools.web import WebRequestTool
+    except ImportError as e:
+        print(f"\n✗ Missing dependency: {e}. Install with: pip install -r requirements.txt", file=sys.stderr)
+        sys.exit(1)
+    
+    cache = None
+    logger = None
+    
     try:
         # Initialize components
         print(f"Loading policy: {args.policy}")
         policy = Policy.load(args.policy)
         
+        if args.cache:
+            print(f"Caching model responses in: {args.cache}")
+            cache = ShelveChatCache(args.cache)
+        
         print(f"Initializing model: {args.model}")
-        model = OpenAIClient(model=args.model)
+        model = OpenAIClient(model=args.model, cache=cache)
         
         tools = [ReadFileTool(), WebRequestTool()]
         print(f"Tools available: {[t.name for t in tools]}")
@@ -134,6 +152,10 @@ Examples:
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    
+    finally:
+        if cache:
+            cache.close()
 
 
 if __name__ == "__main__":
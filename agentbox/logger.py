@@ -1,50 +1,112 @@
 """JSONL audit logging for runtime events."""
 
-import json
-from datetime import datetime
-from typing import Any, Dict, Optional
+import atexit
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from agentbox._compat import dumps
+
+_TS_FMT = "%Y-%m-%dT%H:%M:%S"
 
 
 class AuditLogger:
     """Logs all runtime events to JSONL file for security audit trail."""
     
-    def __init__(self, filepath: str):
+    def __init__(
+        self,
+        filepath: str,
+        flush_threshold_bytes: int = 64 * 1024,
+        flush_threshold_events: int = 64
+    ):
         self.filepath = filepath
-        self.file = open(filepath, 'a', encoding='utf-8')
+        # Large buffer; durability comes from the fsync in close()
+        self.file = open(filepath, 'ab', buffering=1024 * 1024)
+        self.flush_threshold_bytes = flush_threshold_bytes
+        self.flush_threshold_events = flush_threshold_events
+        
+        # Events are buffered and written in batches to avoid a write+flush per event
+        self._buf: List[bytes] = []
+        self._buf_bytes = 0
+        # Tool calls are executed from worker threads
+        self._lock = threading.Lock()
+        
+        # Formatted whole-second part of the last timestamp, reused within the same second
+        self._ts_sec = -1
+        self._ts_prefix = ""
+        atexit.register(self.flush)
     
     def log_event(self, event_type: str, data: Dict[str, Any]) -> None:
         """Log single event with timestamp."""
-        event = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "event_type": event_type,
-            **data
-        }
-        self.file.write(json.dumps(event) + "\n")
-        self.file.flush()
+        # Splice the header fields onto the serialized payload instead of
+        # merging into a new dict and serializing that
+        payload = dumps(data)
+        header = b'","event_type":' + dumps(event_type)
+        body = (b"," + payload[1:] if len(payload) > 2 else b"}") + b"\n"
+        
+        with self._lock:
+            t = time.time()
+            sec = int(t)
+            if sec != self._ts_sec:
+                self._ts_sec = sec
+                self._ts_prefix = time.strftime(_TS_FMT, time.gmtime(sec))
+            ts = f"{self._ts_prefix}.{int((t - sec) * 1_000_000):06d}Z"
+            
+            line = b'{"timestamp":"' + ts.encode() + header + body
+            self._buf.append(line)
+            self._buf_bytes += len(line)
+            full = (len(self._buf) >= self.flush_threshold_events
+                    or self._buf_bytes >= self.flush_threshold_bytes)
+        
+        if full:
+            # Hand the batch to the OS; leaving it in the file buffer would hold up to 1 MiB back
+            self.flush()
+    
+    def _drain(self) -> None:
+        """Write buffered events to the log file."""
+        with self._lock:
+            if not self._buf or self.file.closed:
+                return
+            self.file.writelines(self._buf)
+            self._buf.clear()
+            self._buf_bytes = 0
+    
+    def flush(self) -> None:
+        """Push buffered events through to the OS."""
+        self._drain()
+        if not self.file.closed:
+            self.file.flush()
     
     def log_tool_validation(
         self,
         tool_name: str,
         args: Dict[str, Any],
         allowed: bool,
-        reason: str
+        reason: str,
+        call_id: Optional[str] = None
     ) -> None:
         """Log policy validation decision."""
-        self.log_event("tool_validation", {
+        data = {
             "tool_name": tool_name,
             "args": args,
             "allowed": allowed,
             "reason": reason
-        })
+        }
+        if call_id:
+            data["call_id"] = call_id
+        self.log_event("tool_validation", data)
     
     def log_tool_result(
         self,
         tool_name: str,
         success: bool,
         result: Optional[str] = None,
-        error: Optional[str] = None
+        error: Optional[str] = None,
+        call_id: Optional[str] = None,
+        cached: bool = False
     ) -> None:
-        """Log tool execution result."""
+        """Log tool execution result. cached marks a call answered from an earlier identical call."""
         data = {
             "tool_name": tool_name,
             "success": success
@@ -53,6 +115,10 @@ class AuditLogger:
             data["result"] = result[:200]  # Truncate long results
         if error:
             data["error"] = error
+        if call_id:
+            data["call_id"] = call_id
+        if cached:
+            data["cached"] = True
         
         self.log_event("tool_result", data)
     
@@ -61,7 +127,12 @@ class AuditLogger:
         self.log_event("runtime_error", {"error": error})
     
     def close(self) -> None:
-        """Close log file."""
+        """Flush buffered events, sync to disk and close log file."""
+        if self.file.closed:
+            return
+        self.flush()
+        atexit.unregister(self.flush)
+        os.fsync(self.file.fileno())
         self.file.close()
     
     def __enter__(self):
@@ -6,6 +6,16 @@ model-agnostic agent execution with support for multiple LLM providers.
 """
 
 from .base import BaseModelClient, ToolInvocation
+from .cache import ChatCache, LRUChatCache, ShelveChatCache
 from .openai_client import OpenAIClient
+from .async_openai_client import AsyncOpenAIClient
 
-__all__ = ["BaseModelClient", "ToolInvocation", "OpenAIClient"]
+__all__ = [
+    "BaseModelClient",
+    "ToolInvocation",
+    "ChatCache",
+    "LRUChatCache",
+    "ShelveChatCache",
+    "OpenAIClient",
+    "AsyncOpenAIClient",
+]
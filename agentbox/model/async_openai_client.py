@@ -0,0 +1,85 @@
+"""Asyncio implementation of the OpenAI model client."""
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+from .base import ToolInvocation
+from .cache import make_cache_key
+from .openai_client import HTTP_CLIENT_OPTIONS, OpenAIClient
+
+
+class AsyncOpenAIClient(OpenAIClient):
+    """OpenAIClient whose chat() is a coroutine. Each event loop it is used from gets its own HTTP client."""
+    
+    def _init_client(self) -> None:
+        # AsyncClient connections are tied to the event loop that opened them, so
+        # clients are created on first use from each running loop and never shared
+        self._clients: "weakref.WeakKeyDictionary[Any, Tuple[httpx.AsyncClient, AsyncOpenAI]]" = weakref.WeakKeyDictionary()
+        # Loops on different threads share the mapping
+        self._clients_lock = threading.Lock()
+    
+    async def _get_client(self) -> AsyncOpenAI:
+        """Client for the running event loop, created on first use from it."""
+        loop = asyncio.get_running_loop()
+        with self._clients_lock:
+            entry = self._clients.get(loop)
+            if entry is None or entry[0].is_closed:
+                http_client = DefaultAsyncHttpxClient(**HTTP_CLIENT_OPTIONS)
+                entry = (http_client, AsyncOpenAI(api_key=self.api_key, http_client=http_client))
+                self._clients[loop] = entry
+        return entry[1]
+    
+    async def aclose(self) -> None:
+        """Close the running loop's pooled HTTP connections. Other loops' clients are left alone."""
+        with self._clients_lock:
+            entry = self._clients.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[0].aclose()
+    
+    def close(self) -> None:
+        """Close pooled HTTP connections from outside an event loop."""
+        with self._clients_lock:
+            # A loop still running elsewhere owns its client and closes it with aclose()
+            idle = [(loop, entry) for loop, entry in self._clients.items() if not loop.is_running()]
+            for loop, _ in idle:
+                del self._clients[loop]
+        for loop, (http_client, _) in idle:
+            if loop.is_closed():
+                # The connections can't be closed once their loop is gone; just drop them
+                continue
+            loop.run_until_complete(http_client.aclose())
+    
+    def __del__(self):
+        # AsyncClient can only be closed from an event loop; see aclose()
+        pass
+    
+    async def chat(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]] = None,
+        **kwargs
+    ) -> Tuple[Optional[str], List[ToolInvocation]]:
+        request_params = self._build_request(messages, tools, kwargs)
+        
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_cache_key(request_params)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return self._from_cache(cached)
+        
+        try:
+            client = await self._get_client()
+            response = await client.chat.completions.create(**request_params)
+        except Exception as e:
+            raise Exception(f"OpenAI API request failed: {str(e)}") from e
+        
+        result = self._parse_response(response)
+        if cache_key is not None:
+            self.cache.put(cache_key, self._to_cache(result))
+        return result
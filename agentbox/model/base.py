@@ -1,16 +1,20 @@
 """Model-agnostic interface for LLM providers."""
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
+from agentbox._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ToolInvocation:
     """Normalized tool call schema across all model providers."""
     name: str
     args: Dict[str, Any]
     call_id: Optional[str] = None
+    # Provider's wire-format tool call, echoed back verbatim in the assistant message
+    raw: Optional[Dict[str, Any]] = field(default=None, compare=False, repr=False)
 
 
 class BaseModelClient(ABC):
@@ -30,4 +34,8 @@ class BaseModelClient(ABC):
         tool_calls is list of ToolInvocation objects.
         """
         pass
+    
+    async def aclose(self) -> None:
+        """Release resources bound to the running event loop. AgentRuntime.run() calls this before its loop closes."""
+        pass
 
@@ -0,0 +1,78 @@
+"""Opt-in response caches for model clients, keyed by a hash of the request."""
+
+import hashlib
+import shelve
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from agentbox._compat import dumps
+
+# (content, tool_calls as plain dicts)
+CachedResponse = Tuple[Optional[str], List[Dict[str, Any]]]
+
+
+def make_cache_key(request: Dict[str, Any]) -> str:
+    """Content hash of a chat request (model, messages, tools, extra params)."""
+    return hashlib.blake2b(dumps(request, sort_keys=True, default=str), digest_size=32).hexdigest()
+
+
+class ChatCache(ABC):
+    """Storage for chat responses. Implementations must be safe to call from multiple threads."""
+    
+    @abstractmethod
+    def get(self, key: str) -> Optional[CachedResponse]:
+        pass
+    
+    @abstractmethod
+    def put(self, key: str, value: CachedResponse) -> None:
+        pass
+    
+    def close(self) -> None:
+        """Release any underlying storage."""
+        pass
+
+
+class LRUChatCache(ChatCache):
+    """In-process cache holding the most recently used responses."""
+    
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+    
+    def put(self, key: str, value: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+class ShelveChatCache(ChatCache):
+    """On-disk cache that persists across runs."""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._db = shelve.open(path)
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            return self._db.get(key)
+    
+    def put(self, key: str, value: CachedResponse) -> None:
+        with self._lock:
+            self._db[key] = value
+    
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
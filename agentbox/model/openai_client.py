@@ -1,20 +1,65 @@
 """OpenAI implementation of BaseModelClient."""
 
+import dataclasses
+import importlib.util
+import json
 import os
+import re
 from typing import Any, Dict, List, Optional, Tuple
 
-from openai import OpenAI
+import httpx
+from openai import DefaultHttpxClient, OpenAI
 
 from .base import BaseModelClient, ToolInvocation
+from .cache import CachedResponse, ChatCache, make_cache_key
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Shared by the sync and async clients; the SDK's Default*HttpxClient fills in the rest
+HTTP_CLIENT_OPTIONS: Dict[str, Any] = {
+    "http2": _HTTP2_AVAILABLE,
+    "limits": httpx.Limits(
+        max_keepalive_connections=32,
+        max_connections=64,
+        keepalive_expiry=30.0
+    ),
+    "timeout": httpx.Timeout(60.0, connect=10.0),
+}
+
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:
+    _orjson_loads = None
+
+# orjson turns integers outside the 64-bit range into floats; any such literal has 19+ digits
+_LONG_DIGIT_RUN = re.compile(r"\d{19}")
+
+
+def _parse_arguments(arguments: str) -> Any:
+    """Parse tool-call arguments exactly as json.loads would, using orjson when it agrees."""
+    if _orjson_loads is None or _LONG_DIGIT_RUN.search(arguments):
+        return json.loads(arguments)
+    try:
+        return _orjson_loads(arguments)
+    except ValueError:
+        # orjson rejects some input json accepts, e.g. escaped lone surrogates
+        return json.loads(arguments)
+
+
 class OpenAIClient(BaseModelClient):
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4o-mini"):
-        """Initialize with API key from argument or OPENAI_API_KEY env var."""
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gpt-4o-mini",
+        cache: Optional[ChatCache] = None
+    ):
+        """Initialize with API key from argument or OPENAI_API_KEY env var. Responses are cached only if a cache is given."""
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError(
@@ -23,7 +68,22 @@ class OpenAIClient(BaseModelClient):
             )
         
         self.model = model
-        self.client = OpenAI(api_key=self.api_key)
+        self.cache = cache
+        self._init_client()
+    
+    def _init_client(self) -> None:
+        # One pooled keep-alive client per instance so later turns skip the TCP/TLS handshake
+        self.http_client = DefaultHttpxClient(**HTTP_CLIENT_OPTIONS)
+        self.client = OpenAI(api_key=self.api_key, http_client=self.http_client)
+    
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self.http_client.close()
+    
+    def __del__(self):
+        http_client = getattr(self, "http_client", None)
+        if http_client is not None:
+            http_client.close()
     
     def chat(
         self,
@@ -31,6 +91,31 @@ class OpenAIClient(BaseModelClient):
         tools: Optional[List[Dict[str, Any]]] = None,
         **kwargs
     ) -> Tuple[Optional[str], List[ToolInvocation]]:
+        request_params = self._build_request(messages, tools, kwargs)
+        
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_cache_key(request_params)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return self._from_cache(cached)
+        
+        try:
+            response = self.client.chat.completions.create(**request_params)
+        except Exception as e:
+            raise Exception(f"OpenAI API request failed: {str(e)}") from e
+        
+        result = self._parse_response(response)
+        if cache_key is not None:
+            self.cache.put(cache_key, self._to_cache(result))
+        return result
+    
+    def _build_request(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]],
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
         request_params: Dict[str, Any] = {
             "model": self.model,
             "messages": messages,
@@ -40,11 +125,9 @@ class OpenAIClient(BaseModelClient):
         if tools:
             request_params["tools"] = tools
         
-        try:
-            response = self.client.chat.completions.create(**request_params)
-        except Exception as e:
-            raise Exception(f"OpenAI API request failed: {str(e)}") from e
-        
+        return request_params
+    
+    def _parse_response(self, response: Any) -> Tuple[Optional[str], List[ToolInvocation]]:
         choice = response.choices[0]
         message = choice.message
         content = message.content if message.content else None
@@ -52,15 +135,25 @@ class OpenAIClient(BaseModelClient):
         # Normalize OpenAI's tool_calls to ToolInvocation schema
         tool_calls: List[ToolInvocation] = []
         if message.tool_calls:
-            import json
             for tool_call in message.tool_calls:
                 tool_calls.append(
                     ToolInvocation(
                         name=tool_call.function.name,
-                        args=json.loads(tool_call.function.arguments),
-                        call_id=tool_call.id
+                        args=_parse_arguments(tool_call.function.arguments),
+                        call_id=tool_call.id,
+                        raw=tool_call.model_dump(exclude_none=True)
                     )
                 )
         
         return content, tool_calls
+    
+    @staticmethod
+    def _to_cache(result: Tuple[Optional[str], List[ToolInvocation]]) -> CachedResponse:
+        content, tool_calls = result
+        return content, [dataclasses.asdict(tc) for tc in tool_calls]
+    
+    @staticmethod
+    def _from_cache(cached: CachedResponse) -> Tuple[Optional[str], List[ToolInvocation]]:
+        content, tool_calls = cached
+        return content, [ToolInvocation(**tc) for tc in tool_calls]
 
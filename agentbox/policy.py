@@ -2,15 +2,41 @@
 
 import fnmatch
 import os
+import re
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 
 import yaml
 
+from agentbox._compat import DATACLASS_SLOTS
 
-@dataclass
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader
+
+# Parsed policy files keyed by (abspath, mtime_ns, size), least recently used first
+_POLICY_CACHE: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+_POLICY_CACHE_MAX = 100
+
+# Per-policy validation decisions, keyed by the caller's canonical (tool_name, args) key
+_DECISION_CACHE_MAX = 1024
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy of parsed policy data: mappings become proxies, lists become tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class PolicyDecision:
     allowed: bool
     reason: str
@@ -20,108 +46,178 @@ class Policy:
     """Validates tool calls against YAML-defined rules. Default deny: all tools blocked unless explicitly allowed."""
     
     def __init__(self, policy_data: Dict[str, Any]):
-        self.tools = policy_data.get("tools", {})
-        self.limits = policy_data.get("limits", {})
+        # Read-only, so cached decisions can't go stale
+        self.tools: Mapping[str, Any] = _freeze(policy_data.get("tools", {}))
+        self.limits: Mapping[str, Any] = _freeze(policy_data.get("limits", {}))
         self.max_tool_calls = self.limits.get("max_tool_calls", float('inf'))
         self.max_runtime_seconds = self.limits.get("max_runtime_seconds", float('inf'))
+        self.max_tool_concurrency = self.limits.get("max_tool_concurrency")
+        self._compile()
+    
+    def _compile(self) -> None:
+        """Precompute matchers for the built-in validators so per-call checks stay cheap."""
+        read_policy = self.tools.get("read_file") or {}
+        self._allow_paths = list(read_policy.get("allow_paths", []))
+        self._read_file_wildcard = "./**" in self._allow_paths or "**" in self._allow_paths
+        self._read_file_patterns = []
+        for pattern in self._allow_paths:
+            normalized_pattern = os.path.normpath(pattern)
+            regex = re.compile(fnmatch.translate(normalized_pattern))
+            self._read_file_patterns.append((pattern, normalized_pattern, regex))
+        
+        web_policy = self.tools.get("web_request") or {}
+        self._allow_domains_list = list(web_policy.get("allow_domains", []))
+        allow_domains = [d.lower() for d in self._allow_domains_list]
+        self._allow_any_domain = "*" in allow_domains
+        self._allow_domains_exact = frozenset(allow_domains)
+        # Subdomain matching: wikipedia.org matches en.wikipedia.org
+        self._allow_domain_suffixes = tuple("." + d for d in allow_domains if d != "*")
+        self._allow_methods_list = list(web_policy.get("allow_methods", []))
+        self._allow_methods = frozenset(self._allow_methods_list)
+        
+        self._validators = {
+            "web_request": self._validate_web_request,
+            "read_file": self._validate_read_file,
+        }
+        # Decisions depend only on the rules above, which can't change after construction
+        self._decision_cache: "OrderedDict[Hashable, PolicyDecision]" = OrderedDict()
     
     @classmethod
     def load(cls, yaml_path: str) -> "Policy":
-        """Load and parse YAML policy file."""
-        if not os.path.exists(yaml_path):
+        """Load and parse YAML policy file. Parsed files are cached until they change on disk."""
+        try:
+            st = os.stat(yaml_path)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Policy file not found: {yaml_path}")
         
+        key = (os.path.abspath(yaml_path), st.st_mtime_ns, st.st_size)
+        cached = _POLICY_CACHE.get(key)
+        if cached is not None:
+            _POLICY_CACHE.move_to_end(key)
+            return cls(cached)
+        
         try:
-            with open(yaml_path, 'r', encoding='utf-8') as f:
-                policy_data = yaml.safe_load(f)
+            with open(yaml_path, 'rb') as f:
+                policy_data = yaml.load(f, Loader=_Loader)
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f"Invalid YAML in policy file: {e}")
         
         if not isinstance(policy_data, dict):
             raise ValueError("Policy file must contain a YAML dictionary")
         
+        _POLICY_CACHE[key] = policy_data
+        if len(_POLICY_CACHE) > _POLICY_CACHE_MAX:
+            _POLICY_CACHE.popitem(last=False)
+        
         return cls(policy_data)
     
-    def validate(self, tool_name: str, tool_args: Dict[str, Any]) -> PolicyDecision:
-        """Validate tool call against policy. Returns decision with clear denial reason."""
+    def validate(
+        self,
+        tool_name: str,
+        tool_args: Dict[str, Any],
+        cache_key: Optional[Hashable] = None
+    ) -> PolicyDecision:
+        """
+        Validate tool call against policy. Returns decision with clear denial reason.
+        
+        cache_key, if given, must uniquely identify (tool_name, tool_args), e.g. the
+        runtime's canonical args encoding; decisions are then cached under it. Without
+        one the call is validated directly, since building a key costs about as much.
+        """
+        if cache_key is None:
+            return self._decide(tool_name, tool_args)
+        
+        cache = self._decision_cache
+        decision = cache.get(cache_key)
+        if decision is not None:
+            cache.move_to_end(cache_key)
+            return decision
+        
+        decision = self._decide(tool_name, tool_args)
+        cache[cache_key] = decision
+        if len(cache) > _DECISION_CACHE_MAX:
+            cache.popitem(last=False)
+        return decision
+    
+    def validate_batch(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        cache_keys: Optional[Sequence[Hashable]] = None
+    ) -> List[PolicyDecision]:
+        """Validate (tool_name, tool_args) pairs from one turn in a single pass. Same rules as validate()."""
+        validate = self.validate
+        if cache_keys is None:
+            return [validate(tool_name, tool_args) for tool_name, tool_args in calls]
+        return [validate(tool_name, tool_args, key) for (tool_name, tool_args), key in zip(calls, cache_keys)]
+    
+    def _decide(self, tool_name: str, tool_args: Dict[str, Any]) -> PolicyDecision:
         if tool_name not in self.tools:
             return PolicyDecision(
                 allowed=False,
                 reason=f"Tool '{tool_name}' is not in the policy (default deny)"
             )
         
-        tool_policy = self.tools[tool_name]
-        
-        if tool_name == "web_request":
-            return self._validate_web_request(tool_args, tool_policy)
-        elif tool_name == "read_file":
-            return self._validate_read_file(tool_args, tool_policy)
-        else:
+        validator = self._validators.get(tool_name)
+        if validator is None:
             return PolicyDecision(
                 allowed=False,
                 reason=f"No validation logic for tool '{tool_name}'"
             )
+        return validator(tool_args)
     
-    def _validate_web_request(self, args: Dict[str, Any], tool_policy: Dict[str, Any]) -> PolicyDecision:
+    def _validate_web_request(self, args: Dict[str, Any]) -> PolicyDecision:
         url = args.get("url", "")
         method = args.get("method", "GET").upper()
         
         try:
             parsed_url = urlparse(url)
-            domain = parsed_url.netloc.split(':')[0]  # Remove port
+            domain = parsed_url.netloc.split(':')[0].lower()  # Remove port
         except Exception:
             return PolicyDecision(allowed=False, reason=f"Invalid URL format: {url}")
         
-        allow_domains = tool_policy.get("allow_domains", [])
-        
-        if "*" not in allow_domains:
-            domain_allowed = any(self._domain_matches(domain, allowed) for allowed in allow_domains)
-            if not domain_allowed:
-                return PolicyDecision(
-                    allowed=False,
-                    reason=f"Domain '{domain}' not in allow_domains: {allow_domains}"
-                )
+        if not self._allow_any_domain and not (
+            domain in self._allow_domains_exact or domain.endswith(self._allow_domain_suffixes)
+        ):
+            return PolicyDecision(
+                allowed=False,
+                reason=f"Domain '{domain}' not in allow_domains: {self._allow_domains_list}"
+            )
         
-        allow_methods = tool_policy.get("allow_methods", [])
-        if method not in allow_methods:
+        if method not in self._allow_methods:
             return PolicyDecision(
                 allowed=False,
-                reason=f"HTTP method '{method}' not in allow_methods: {allow_methods}"
+                reason=f"HTTP method '{method}' not in allow_methods: {self._allow_methods_list}"
             )
         
         return PolicyDecision(allowed=True, reason=f"Allowed: domain '{domain}' and method '{method}'")
     
-    def _validate_read_file(self, args: Dict[str, Any], tool_policy: Dict[str, Any]) -> PolicyDecision:
+    def _validate_read_file(self, args: Dict[str, Any]) -> PolicyDecision:
         path = args.get("path", "")
         
         if not path:
             return PolicyDecision(allowed=False, reason="No path provided")
         
         normalized_path = os.path.normpath(path)
-        allow_paths = tool_policy.get("allow_paths", [])
         
         # Wildcard check
-        if "./**" in allow_paths or "**" in allow_paths:
+        if self._read_file_wildcard:
             return PolicyDecision(allowed=True, reason=f"Allowed: wildcard pattern")
         
-        # Pattern matching with fnmatch and pathlib
-        for pattern in allow_paths:
-            normalized_pattern = os.path.normpath(pattern)
-            
-            if fnmatch.fnmatch(normalized_path, normalized_pattern):
+        # Pattern matching with precompiled fnmatch regexes, falling back to pathlib
+        path_obj = None
+        for pattern, normalized_pattern, regex in self._read_file_patterns:
+            if regex.match(normalized_path) is not None:
                 return PolicyDecision(allowed=True, reason=f"Allowed: path '{path}' matches '{pattern}'")
             
             try:
-                if Path(normalized_path).match(normalized_pattern):
+                if path_obj is None:
+                    path_obj = Path(normalized_path)
+                if path_obj.match(normalized_pattern):
                     return PolicyDecision(allowed=True, reason=f"Allowed: path '{path}' matches '{pattern}'")
             except Exception:
                 pass
         
-        return PolicyDecision(allowed=False, reason=f"Path '{path}' not in allow_paths: {allow_paths}")
-    
-    def _domain_matches(self, domain: str, pattern: str) -> bool:
-        """Subdomain matching: wikipedia.org matches en.wikipedia.org"""
-        return domain == pattern or domain.endswith('.' + pattern)
+        return PolicyDecision(allowed=False, reason=f"Path '{path}' not in allow_paths: {self._allow_paths}")
 
 
 class PolicyDeniedError(Exception):
@@ -1,16 +1,29 @@
 """Agent runtime loop with policy enforcement and budget limits."""
 
+import asyncio
+import functools
+import inspect
 import time
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
+from agentbox._compat import dumps
 from agentbox.model import BaseModelClient
-from agentbox.policy import Policy, PolicyDeniedError
+from agentbox.policy import Policy, PolicyDecision, PolicyDeniedError
 from agentbox.tools import SafeTool
 
 if TYPE_CHECKING:
     from agentbox.logger import AuditLogger
 
 
+def _dumps(obj: Any) -> str:
+    return dumps(obj).decode("utf-8")
+
+
+def _canonical_args(args: Dict[str, Any]) -> bytes:
+    return dumps(args, sort_keys=True)
+
+
 class BudgetExceededError(Exception):
     """Raised when budget limits are exceeded."""
     pass
@@ -29,12 +42,39 @@ class AgentRuntime:
         model_client: BaseModelClient,
         tools: List[SafeTool],
         policy: Policy,
-        logger: Optional["AuditLogger"] = None
+        logger: Optional["AuditLogger"] = None,
+        max_workers: Optional[int] = None,
+        max_tool_result_bytes: int = 16384,
+        max_context_messages: int = 40,
+        preserve_first_message: bool = True
     ):
+        # The window needs room for at least one message after the preserved first one
+        min_context_messages = 2 if preserve_first_message else 1
+        if max_context_messages < min_context_messages:
+            raise ValueError(f"max_context_messages must be at least {min_context_messages}")
+        
         self.model_client = model_client
         self.tools = {tool.name: tool for tool in tools}
         self.policy = policy
         self.logger = logger
+        self.max_tool_result_bytes = max_tool_result_bytes
+        self.max_context_messages = max_context_messages
+        self.preserve_first_message = preserve_first_message
+        self._tool_schemas = [tool.to_openai_schema() for tool in self.tools.values()]
+        
+        # Tools are I/O-bound, so calls from one turn run concurrently. The pool is
+        # per-instance so nested runtimes can't starve each other of workers.
+        self.max_tool_concurrency = max_workers or policy.max_tool_concurrency or 8
+        self._executor = ThreadPoolExecutor(max_workers=self.max_tool_concurrency)
+    
+    def close(self) -> None:
+        """Shut down the tool executor."""
+        self._executor.shutdown(wait=True)
+    
+    def __del__(self):
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
     
     def run(
         self,
@@ -44,51 +84,91 @@ class AgentRuntime:
         """
         Execute agent runtime loop with policy and budget enforcement.
         
+        Blocking wrapper around run_async(); must not be called from a running event loop.
+        
         Returns: Final assistant response content
         """
-        start_time = time.time()
+        async def run_and_close() -> str:
+            try:
+                return await self.run_async(messages, max_iterations=max_iterations)
+            finally:
+                # Loop-bound clients can't outlive the loop asyncio.run() is about to close
+                await self.aclose()
+        
+        return asyncio.run(run_and_close())
+    
+    async def aclose(self) -> None:
+        """Release the tools' and model client's resources bound to the running event loop."""
+        for tool in self.tools.values():
+            await tool.aclose()
+        await self.model_client.aclose()
+    
+    async def run_async(
+        self,
+        messages: List[Dict[str, Any]],
+        max_iterations: int = 10
+    ) -> str:
+        """
+        Execute agent runtime loop on the running event loop.
+        
+        Async model clients and tools are awaited directly; sync ones run on the
+        runtime's thread pool, so a turn's tool calls overlap either way. Clients
+        stay open for later runs on the same loop; await aclose() when done with it.
+        
+        Returns: Final assistant response content
+        """
+        loop = asyncio.get_running_loop()
+        monotonic = time.monotonic
+        start_time = monotonic()
         tool_call_count = 0
         
+        # Loop invariants bound to locals
+        max_runtime_seconds = self.policy.max_runtime_seconds
+        deadline = start_time + max_runtime_seconds
+        max_tool_calls = self.policy.max_tool_calls
+        chat = self._chat
+        context_window = self._context_window
+        execute_turn = self._execute_turn
+        # Bounds natively async tools, which don't queue on the executor
+        semaphore = asyncio.Semaphore(self.max_tool_concurrency)
+        # Results of idempotent tool calls, reused for the rest of this run
+        result_cache: Dict[Tuple[str, Any], Dict[str, Any]] = {}
+        
         try:
             for iteration in range(max_iterations):
                 # Budget enforcement
-                elapsed = time.time() - start_time
-                if elapsed > self.policy.max_runtime_seconds:
-                    error_msg = f"Runtime limit exceeded: {elapsed:.1f}s > {self.policy.max_runtime_seconds}s"
+                now = monotonic()
+                if now > deadline:
+                    elapsed = now - start_time
+                    error_msg = f"Runtime limit exceeded: {elapsed:.1f}s > {max_runtime_seconds}s"
                     if self.logger:
                         self.logger.log_runtime_error(error_msg)
                     raise BudgetExceededError(error_msg)
                 
-                if tool_call_count >= self.policy.max_tool_calls:
-                    error_msg = f"Tool call limit exceeded: {tool_call_count} >= {self.policy.max_tool_calls}"
+                if tool_call_count >= max_tool_calls:
+                    error_msg = f"Tool call limit exceeded: {tool_call_count} >= {max_tool_calls}"
                     if self.logger:
                         self.logger.log_runtime_error(error_msg)
                     raise BudgetExceededError(error_msg)
                 
                 # Get LLM response
-                tool_schemas = [t.to_openai_schema() for t in self.tools.values()]
-                content, tool_calls = self.model_client.chat(messages, tools=tool_schemas)
+                content, tool_calls = await chat(loop, context_window(messages))
                 
                 # No tools called → agent is done
                 if not tool_calls:
                     return content or ""
                 
-                # Execute tool calls
-                tool_results = []
-                for tc in tool_calls:
-                    result = self._execute_tool(tc)
-                    tool_results.append(result)
-                    tool_call_count += 1
+                tool_results, executed = await execute_turn(tool_calls, semaphore, result_cache)
+                tool_call_count += executed
                 
-                # Append assistant message with tool calls
-                messages.append({
+                # Assistant message with tool calls, then its tool results, in one extend
+                new_records = [{
                     "role": "assistant",
                     "content": content,
                     "tool_calls": self._format_tool_calls_for_openai(tool_calls)
-                })
-                
-                # Append tool results
-                messages.extend(tool_results)
+                }]
+                new_records.extend(tool_results)
+                messages.extend(new_records)
             
             raise MaxIterationsError(f"Max iterations ({max_iterations}) reached without completion")
         
@@ -97,8 +177,115 @@ class AgentRuntime:
                 self.logger.log_runtime_error(str(e))
             raise
     
-    def _execute_tool(self, tool_invocation) -> Dict[str, Any]:
-        """Execute single tool with policy validation."""
+    async def _execute_turn(
+        self,
+        tool_calls: List[Any],
+        semaphore: asyncio.Semaphore,
+        result_cache: Dict[Tuple[str, Any], Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Run one turn's tool calls. Identical calls (same tool and args) to an idempotent
+        tool execute once, and their successful results are reused in later turns. Every
+        call answered without executing is still logged, flagged as cached.
+        
+        Returns: (one result message per tool call in order, number of calls executed)
+        """
+        keys = []
+        for index, tc in enumerate(tool_calls):
+            key = (tc.name, _canonical_args(tc.args))
+            tool = self.tools.get(tc.name)
+            if tool is None or not tool.idempotent:
+                # Repeats may be deliberate (e.g. two POSTs), so each call runs on its own
+                key += (index,)
+            keys.append(key)
+        pending: Dict[Tuple[Any, ...], Any] = {}
+        for key, tc in zip(keys, tool_calls):
+            if key not in pending and key not in result_cache:
+                pending[key] = tc
+        pending_calls = list(pending.values())
+        
+        # Validate the whole batch up front, then execute concurrently;
+        # gather keeps submission order
+        decisions = self.policy.validate_batch(
+            [(tc.name, tc.args) for tc in pending_calls],
+            cache_keys=[key[:2] for key in pending]
+        )
+        if len(pending_calls) == 1:
+            outcomes = [await self._execute_tool_async(pending_calls[0], decisions[0], semaphore)]
+        else:
+            outcomes = await asyncio.gather(*(
+                self._execute_tool_async(tc, decision, semaphore)
+                for tc, decision in zip(pending_calls, decisions)
+            ))
+        
+        # key -> (result message, error or None on success)
+        executed = dict(zip(pending, outcomes))
+        for key, tc in pending.items():
+            result, error = executed[key]
+            # Failures may be transient, so only successes are reused
+            if error is None and self.tools[tc.name].idempotent:
+                result_cache[key] = result
+        
+        tool_results = []
+        for key, tc in zip(keys, tool_calls):
+            if key in executed:
+                result, error = executed[key]
+            else:
+                result, error = result_cache[key], None
+            
+            if pending.get(key) is not tc and self.logger:
+                self.logger.log_tool_result(
+                    tc.name,
+                    success=error is None,
+                    result=result["content"] if error is None else None,
+                    error=error,
+                    call_id=tc.call_id,
+                    cached=True
+                )
+            
+            if result["tool_call_id"] != tc.call_id:
+                result = {**result, "tool_call_id": tc.call_id}
+            tool_results.append(result)
+        
+        return tool_results, len(pending_calls)
+    
+    async def _chat(self, loop: asyncio.AbstractEventLoop, messages: List[Dict[str, Any]]):
+        """Call the model client, awaiting it if chat() is a coroutine."""
+        chat = self.model_client.chat
+        if inspect.iscoroutinefunction(chat):
+            return await chat(messages, tools=self._tool_schemas)
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(chat, messages, tools=self._tool_schemas)
+        )
+    
+    def _context_window(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Bound the history sent to the model: the first message plus the most recent ones."""
+        limit = self.max_context_messages
+        if len(messages) <= limit:
+            return messages
+        
+        head = messages[:1] if self.preserve_first_message else []
+        start = len(messages) - limit + len(head)
+        # Tool results must follow the assistant message that requested them. Back up
+        # to it so the latest turn is always sent whole, even if that exceeds the limit.
+        while start > 0 and messages[start].get("role") == "tool":
+            start -= 1
+        if start <= len(head):
+            return messages
+        return head + messages[start:]
+    
+    async def _execute_tool_async(
+        self,
+        tool_invocation,
+        decision: PolicyDecision,
+        semaphore: asyncio.Semaphore
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Execute single tool that has already been checked against the policy.
+        
+        Returns: (tool result message, error or None on success)
+        """
         tool_name = tool_invocation.name
         tool_args = tool_invocation.args
         call_id = tool_invocation.call_id
@@ -107,36 +294,36 @@ class AgentRuntime:
         if tool_name not in self.tools:
             error = f"Tool '{tool_name}' not found"
             if self.logger:
-                self.logger.log_tool_result(tool_name, success=False, error=error)
-            return self._tool_error_result(call_id, tool_name, error)
+                self.logger.log_tool_result(tool_name, success=False, error=error, call_id=call_id)
+            return self._tool_error_result(call_id, tool_name, error), error
         
         tool = self.tools[tool_name]
         
-        # Validate against policy
-        decision = self.policy.validate(tool_name, tool_args)
-        
         if self.logger:
             self.logger.log_tool_validation(
                 tool_name,
                 tool_args,
                 decision.allowed,
-                decision.reason
+                decision.reason,
+                call_id=call_id
             )
         
         if not decision.allowed:
             error = f"Policy denied: {decision.reason}"
-            return self._tool_error_result(call_id, tool_name, error)
+            return self._tool_error_result(call_id, tool_name, error), error
         
         # Execute tool
         try:
-            result = tool.execute(tool_args)
+            async with semaphore:
+                result = await tool.execute_async(tool_args, self._executor)
             if self.logger:
-                self.logger.log_tool_result(tool_name, success=True, result=str(result))
-            return self._tool_success_result(call_id, tool_name, result)
+                self.logger.log_tool_result(tool_name, success=True, result=str(result), call_id=call_id)
+            return self._tool_success_result(call_id, tool_name, result), None
         except Exception as e:
+            error = str(e)
             if self.logger:
-                self.logger.log_tool_result(tool_name, success=False, error=str(e))
-            return self._tool_error_result(call_id, tool_name, str(e))
+                self.logger.log_tool_result(tool_name, success=False, error=error, call_id=call_id)
+            return self._tool_error_result(call_id, tool_name, error), error
     
     def _tool_success_result(
         self,
@@ -146,12 +333,27 @@ class AgentRuntime:
     ) -> Dict[str, Any]:
         """Format successful tool result for OpenAI."""
         # Convert result to string if needed
-        if isinstance(result, dict):
-            import json
-            content = json.dumps(result)
+        if isinstance(result, str):
+            content = result
+        elif isinstance(result, bytes):
+            content = result.decode("utf-8", errors="replace")
+        elif isinstance(result, dict):
+            content = _dumps(result)
         else:
             content = str(result)
         
+        # Cap what gets sent back to the model on the next turn, in UTF-8 bytes.
+        # A character encodes to at most 4 bytes, so short results skip the encode.
+        limit = self.max_tool_result_bytes
+        if len(content) > limit // 4:
+            encoded = content.encode("utf-8")
+            if len(encoded) > limit:
+                # errors="ignore" drops a character split by the cut
+                content = (
+                    encoded[:limit].decode("utf-8", errors="ignore")
+                    + f"...[truncated {len(encoded) - limit} bytes]"
+                )
+        
         return {
             "role": "tool",
             "tool_call_id": call_id,
@@ -170,21 +372,22 @@ class AgentRuntime:
             "role": "tool",
             "tool_call_id": call_id,
             "name": tool_name,
-            "content": f'{{"error": "{error}"}}'
+            "content": _dumps({"error": error})
         }
     
     def _format_tool_calls_for_openai(self, tool_calls) -> List[Dict[str, Any]]:
-        """Convert ToolInvocation list to OpenAI format."""
-        import json
-        
+        """Convert ToolInvocation list to OpenAI format, reusing the provider payload when present."""
         formatted = []
         for tc in tool_calls:
+            if tc.raw is not None:
+                formatted.append(tc.raw)
+                continue
             formatted.append({
                 "id": tc.call_id,
                 "type": "function",
                 "function": {
                     "name": tc.name,
-                    "arguments": json.dumps(tc.args)
+                    "arguments": _dumps(tc.args)
                 }
             })
         return formatted
@@ -1,6 +1,9 @@
 """Base interface for all AgentBox tools with OpenAI schema generation."""
 
+import asyncio
+import functools
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
 if TYPE_CHECKING:
@@ -10,10 +13,21 @@ if TYPE_CHECKING:
 class SafeTool(ABC):
     """All tools inherit from this class. Provides automatic OpenAI schema generation."""
     
+    # True if repeated calls with the same args return the same result, letting the runtime reuse it
+    idempotent: bool = False
+    
     def __init__(self):
         self.name: str = self._get_name()
         self.description: str = self._get_description()
         self.parameters: Dict[str, Any] = self._get_parameters()
+        self._openai_schema: Dict[str, Any] = {
+            "type": "function",
+            "function": {
+                "name": self.name,
+                "description": self.description,
+                "parameters": self.parameters
+            }
+        }
     
     @abstractmethod
     def _get_name(self) -> str:
@@ -33,6 +47,15 @@ class SafeTool(ABC):
         """Execute the tool with provided arguments."""
         pass
     
+    async def execute_async(self, args: Dict[str, Any], executor: Optional[Executor] = None) -> Any:
+        """Execute without blocking the event loop. Default runs execute() on an executor; override for native async I/O."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(self.execute, args))
+    
+    async def aclose(self) -> None:
+        """Close loop-bound clients opened by an execute_async() override. AgentRuntime.aclose() calls this."""
+        pass
+    
     def execute_with_policy(self, args: Dict[str, Any], policy: Optional["Policy"] = None) -> Any:
         """Execute with optional policy validation. Raises PolicyDeniedError if denied."""
         if policy:
@@ -45,13 +68,6 @@ class SafeTool(ABC):
         return self.execute(args)
     
     def to_openai_schema(self) -> Dict[str, Any]:
-        """Convert to OpenAI function calling format."""
-        return {
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": self.parameters
-            }
-        }
+        """Convert to OpenAI function calling format. Built once in __init__; callers must not mutate it."""
+        return self._openai_schema
 
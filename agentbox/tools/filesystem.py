@@ -1,13 +1,32 @@
 """File system tool for reading text files."""
 
+import codecs
 import os
+import stat
 from typing import Any, Dict
 
 from .base import SafeTool
 
+# Larger files are truncated rather than loaded whole; also the ceiling on a caller's max_bytes
+DEFAULT_MAX_BYTES = 512 * 1024
+
+
+def _universal_newlines(text: str) -> str:
+    """Translate CRLF and lone CR line endings to LF, as text-mode open() does."""
+    if "\r" not in text:
+        return text
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
 
 class ReadFileTool(SafeTool):
     
+    idempotent = True
+    
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        # Set before super().__init__(), which builds the schema from it
+        self.max_bytes = max_bytes
+        super().__init__()
+    
     def _get_name(self) -> str:
         return "read_file"
     
@@ -21,6 +40,10 @@ class ReadFileTool(SafeTool):
                 "path": {
                     "type": "string",
                     "description": "Path to the file (absolute or relative)"
+                },
+                "max_bytes": {
+                    "type": "integer",
+                    "description": f"Maximum bytes to read (at most {self.max_bytes}, the default); longer files are truncated"
                 }
             },
             "required": ["path"]
@@ -28,20 +51,38 @@ class ReadFileTool(SafeTool):
     
     def execute(self, args: Dict[str, Any]) -> str:
         path = args.get("path")
+        max_bytes = args.get("max_bytes", self.max_bytes)
         
         if not path or not isinstance(path, str):
             raise ValueError("Path must be a non-empty string")
         
-        if not os.path.exists(path):
+        if not isinstance(max_bytes, int) or isinstance(max_bytes, bool) or max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer")
+        
+        # The model can only lower the tool's own limit, never raise it
+        max_bytes = min(max_bytes, self.max_bytes)
+        
+        # One stat() serves the existence, file-type and size checks
+        try:
+            st = os.stat(path)
+        except (OSError, ValueError):
             raise FileNotFoundError(f"File not found: {path}")
         
-        if not os.path.isfile(path):
+        if not stat.S_ISREG(st.st_mode):
             raise ValueError(f"Path is not a file: {path}")
         
+        size = st.st_size
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            return content
+            with open(path, 'rb') as f:
+                # read(n) allocates n bytes up front, so never ask for more than the file holds;
+                # pseudo-files such as /proc entries report size 0 but still have content
+                data = f.read(min(max_bytes, size) if size else max_bytes)
+            
+            if size > max_bytes:
+                # Incremental decode drops a character split by the cut instead of failing on it
+                content = _universal_newlines(codecs.getincrementaldecoder("utf-8")().decode(data))
+                return content + f"\n...[truncated {size - max_bytes} bytes]"
+            return _universal_newlines(data.decode("utf-8"))
             
         except PermissionError:
             raise PermissionError(f"Permission denied reading file: {path}")
@@ -1,14 +1,89 @@
 """HTTP request tool for web interaction."""
 
-from typing import Any, Dict, Optional
+import http.cookiejar
+import json
+import re
+from typing import Any, Dict, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .base import SafeTool
 
+_ALLOWED_METHODS = frozenset(("GET", "POST"))
+_URL_RE = re.compile(r"^https?://", re.IGNORECASE)
+
+# Default body cap, and the ceiling on a caller's max_bytes
+DEFAULT_MAX_BYTES = 1024 * 1024
+_CHUNK_SIZE = 64 * 1024
+
+# Connection pooling and retries for the shared session
+_POOL_MAXSIZE = 20
+_RETRIES = 2
+_RETRY_BACKOFF = 0.3
+_RETRY_STATUSES = (502, 503, 504)
+
+# Shared by every instance; treat as read-only
+_PARAMETERS: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "url": {
+            "type": "string",
+            "description": "Full URL including http:// or https://"
+        },
+        "method": {
+            "type": "string",
+            "enum": ["GET", "POST"],
+            "description": "HTTP method"
+        },
+        "headers": {
+            "type": "object",
+            "description": "Optional HTTP headers",
+            "additionalProperties": {"type": "string"}
+        },
+        "body": {
+            "type": "object",
+            "description": "Optional JSON body for POST requests"
+        },
+        "max_bytes": {
+            "type": "integer",
+            "description": "Maximum response body bytes to read; can only lower the tool's limit. Longer bodies are truncated"
+        }
+    },
+    "required": ["url", "method"]
+}
+
 
 class WebRequestTool(SafeTool):
     
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        super().__init__()
+        self.max_bytes = max_bytes
+        
+        # Pooled keep-alive session so repeated requests to a host reuse connections
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=_POOL_MAXSIZE,
+            # Once retries run out, return the last response rather than raising
+            max_retries=Retry(
+                total=_RETRIES,
+                backoff_factor=_RETRY_BACKOFF,
+                status_forcelist=_RETRY_STATUSES,
+                raise_on_status=False
+            )
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # Each call stays stateless: never store cookies to replay on later requests
+        self._session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    
+    def __del__(self):
+        session = getattr(self, "_session", None)
+        if session is not None:
+            session.close()
+    
     def _get_name(self) -> str:
         return "web_request"
     
@@ -16,58 +91,50 @@ class WebRequestTool(SafeTool):
         return "Make HTTP GET/POST requests. Returns status code, headers, and body."
     
     def _get_parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "url": {
-                    "type": "string",
-                    "description": "Full URL including http:// or https://"
-                },
-                "method": {
-                    "type": "string",
-                    "enum": ["GET", "POST"],
-                    "description": "HTTP method"
-                },
-                "headers": {
-                    "type": "object",
-                    "description": "Optional HTTP headers",
-                    "additionalProperties": {"type": "string"}
-                },
-                "body": {
-                    "type": "object",
-                    "description": "Optional JSON body for POST requests"
-                }
-            },
-            "required": ["url", "method"]
-        }
+        return _PARAMETERS
     
-    def execute(self, args: Dict[str, Any]) -> Dict[str, Any]:
+    def _parse_args(self, args: Dict[str, Any]) -> Tuple[str, str, Dict[str, str], Any, int]:
         url = args.get("url")
         method = args.get("method", "GET").upper()
         headers = args.get("headers", {})
         body = args.get("body")
+        max_bytes = args.get("max_bytes", self.max_bytes)
         
-        if method not in ["GET", "POST"]:
+        if method not in _ALLOWED_METHODS:
             raise ValueError(f"Invalid HTTP method: {method}. Must be GET or POST.")
         
         if not url or not isinstance(url, str):
             raise ValueError("URL must be a non-empty string")
         
-        if not url.startswith(("http://", "https://")):
+        if not _URL_RE.match(url):
             raise ValueError("URL must start with http:// or https://")
         
+        if not isinstance(max_bytes, int) or isinstance(max_bytes, bool) or max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer")
+        
+        # The model can only lower the tool's own limit, never raise it
+        return url, method, headers, body, min(max_bytes, self.max_bytes)
+    
+    def execute(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        url, method, headers, body, max_bytes = self._parse_args(args)
+        
         try:
-            # 10s timeout prevents hanging
+            # 10s timeout prevents hanging; stream so the body is never read past max_bytes
             if method == "GET":
-                response = requests.get(url, headers=headers, timeout=10)
+                response = self._session.get(url, headers=headers, timeout=10, stream=True)
             else:
-                response = requests.post(url, headers=headers, json=body, timeout=10)
+                response = self._session.post(url, headers=headers, json=body, timeout=10, stream=True)
             
-            return {
-                "status_code": response.status_code,
-                "headers": dict(response.headers),
-                "body": response.text
-            }
+            buf = bytearray()
+            try:
+                for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                    buf += chunk
+                    if len(buf) > max_bytes:
+                        break
+            finally:
+                response.close()
+            
+            return self._format_response(response, buf, max_bytes)
             
         except requests.exceptions.Timeout:
             raise Exception(f"Request to {url} timed out after 10 seconds")
@@ -75,4 +142,30 @@ class WebRequestTool(SafeTool):
             raise Exception(f"Failed to connect to {url}")
         except requests.exceptions.RequestException as e:
             raise Exception(f"Request failed: {str(e)}")
-
+    
+    def _format_response(self, response: Any, buf: bytearray, max_bytes: int) -> Dict[str, Any]:
+        """Build the tool result from a streamed response; buf is the body read so far."""
+        truncated = len(buf) > max_bytes
+        if truncated:
+            del buf[max_bytes:]
+        
+        try:
+            text = buf.decode(response.encoding or "utf-8", errors="replace")
+        except LookupError:
+            text = buf.decode("utf-8", errors="replace")
+        
+        body: Any = text
+        if truncated:
+            body = text + f"\n...[truncated at {max_bytes} bytes]"
+        # Embed JSON as an object so the runtime doesn't re-escape it as a string
+        elif response.headers.get("content-type", "").startswith("application/json"):
+            try:
+                body = json.loads(text)
+            except ValueError:
+                pass
+        
+        return {
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "body": body
+        }
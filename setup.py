@@ -20,7 +20,8 @@ setup(
         ],
     },
     install_requires=[
-        "openai>=1.0.0",
+        "openai>=1.17.0,<3",
+        "httpx>=0.25.0",
         "pyyaml>=6.0",
         "requests>=2.28.0",
     ],
@@ -0,0 +1,90 @@
+"""Tests for the audit logger."""
+
+import json
+import os
+import tempfile
+import unittest
+
+from agentbox.logger import AuditLogger
+
+
+class AuditLoggerTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "audit.jsonl")
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def _lines(self):
+        with open(self.path, "rb") as f:
+            return f.read().splitlines()
+    
+    def test_lines_round_trip(self):
+        logger = AuditLogger(self.path)
+        try:
+            logger.log_event("empty", {})
+            logger.log_event('say "hi"', {"n": 1})
+            logger.log_tool_validation("read_file", {"path": "/tmp/caf\u00e9 \u6587\u4ef6.txt"}, True, "ok", call_id="c1")
+        finally:
+            logger.close()
+        
+        events = [json.loads(line) for line in self._lines()]
+        self.assertEqual(len(events), 3)
+        for event in events:
+            self.assertEqual(list(event)[:2], ["timestamp", "event_type"])
+            self.assertRegex(event["timestamp"], r"^\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{6}Z$")
+        
+        self.assertEqual(events[0], {"timestamp": events[0]["timestamp"], "event_type": "empty"})
+        self.assertEqual(events[1]["event_type"], 'say "hi"')
+        self.assertEqual(events[1]["n"], 1)
+        self.assertEqual(events[2]["args"], {"path": "/tmp/caf\u00e9 \u6587\u4ef6.txt"})
+        self.assertEqual(events[2]["call_id"], "c1")
+    
+    def test_events_are_buffered_until_flush(self):
+        logger = AuditLogger(self.path)
+        try:
+            logger.log_event("first", {})
+            logger.log_event("second", {})
+            self.assertEqual(self._lines(), [])
+            
+            logger.flush()
+            self.assertEqual(len(self._lines()), 2)
+        finally:
+            logger.close()
+    
+    def test_thresholds_write_through(self):
+        by_count = AuditLogger(self.path, flush_threshold_events=3)
+        try:
+            by_count.log_event("a", {})
+            by_count.log_event("b", {})
+            self.assertEqual(self._lines(), [])
+            by_count.log_event("c", {})
+            self.assertEqual(len(self._lines()), 3)
+        finally:
+            by_count.close()
+        
+        os.remove(self.path)
+        by_size = AuditLogger(self.path, flush_threshold_bytes=200)
+        try:
+            by_size.log_event("a", {})
+            self.assertEqual(self._lines(), [])
+            by_size.log_event("b", {"pad": "x" * 200})
+            self.assertEqual(len(self._lines()), 2)
+        finally:
+            by_size.close()
+    
+    def test_close_writes_and_is_idempotent(self):
+        logger = AuditLogger(self.path)
+        logger.log_event("only", {})
+        logger.close()
+        logger.close()
+        logger.flush()
+        
+        self.assertEqual(len(self._lines()), 1)
+        self.assertTrue(logger.file.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
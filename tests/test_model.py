@@ -0,0 +1,150 @@
+"""Tests for the model clients."""
+
+import asyncio
+import json
+import os
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from agentbox.model import AsyncOpenAIClient, OpenAIClient
+from agentbox.model.openai_client import _parse_arguments
+from agentbox.policy import Policy
+from agentbox.runtime import AgentRuntime
+
+
+class _ChatCompletionsHandler(BaseHTTPRequestHandler):
+    """Minimal stand-in for the chat completions endpoint."""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def do_POST(self):
+        request = self.rfile.read(int(self.headers["Content-Length"]))
+        if b"slow" in request:
+            time.sleep(0.5)
+        body = json.dumps({
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "test",
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": "done"}
+            }]
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class AsyncOpenAIClientTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _ChatCompletionsHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        patcher = mock.patch.dict(os.environ, {
+            "OPENAI_BASE_URL": f"http://127.0.0.1:{self.server.server_port}/v1"
+        })
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+    
+    def test_runtime_can_run_repeatedly(self):
+        client = AsyncOpenAIClient(api_key="test")
+        runtime = AgentRuntime(client, [], Policy({}))
+        try:
+            # Each run() uses a fresh event loop
+            for _ in range(2):
+                self.assertEqual(runtime.run([{"role": "user", "content": "hi"}]), "done")
+        finally:
+            runtime.close()
+            client.close()
+    
+    def test_concurrent_runs_share_the_client(self):
+        client = AsyncOpenAIClient(api_key="test")
+        runtime = AgentRuntime(client, [], Policy({}))
+        
+        async def run_both():
+            try:
+                # The fast run finishes while the slow one is still waiting on the client
+                return await asyncio.gather(
+                    runtime.run_async([{"role": "user", "content": "slow"}]),
+                    runtime.run_async([{"role": "user", "content": "fast"}]),
+                )
+            finally:
+                await runtime.aclose()
+        
+        try:
+            self.assertEqual(asyncio.run(run_both()), ["done", "done"])
+        finally:
+            runtime.close()
+            client.close()
+    
+    def test_runs_on_separate_threads_share_the_client(self):
+        client = AsyncOpenAIClient(api_key="test")
+        runtime = AgentRuntime(client, [], Policy({}))
+        try:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                results = list(pool.map(
+                    lambda content: runtime.run([{"role": "user", "content": content}]),
+                    ["slow", "fast"]
+                ))
+            self.assertEqual(results, ["done", "done"])
+        finally:
+            runtime.close()
+            client.close()
+
+
+class HttpClientDefaultsTest(unittest.TestCase):
+    
+    def test_sdk_defaults_are_kept(self):
+        client = OpenAIClient(api_key="test")
+        try:
+            self.assertTrue(client.http_client.follow_redirects)
+            self.assertEqual(client.http_client.timeout.connect, 10.0)
+        finally:
+            client.close()
+        
+        async_client = AsyncOpenAIClient(api_key="test")
+        
+        async def http_client():
+            try:
+                await async_client._get_client()
+                return async_client._clients[asyncio.get_running_loop()][0]
+            finally:
+                await async_client.aclose()
+        
+        self.assertTrue(asyncio.run(http_client()).follow_redirects)
+
+
+class ParseArgumentsTest(unittest.TestCase):
+    
+    def test_matches_json_loads(self):
+        for arguments in (
+            '{"path": "a.txt"}',
+            '{"id": 123456789012345678901234567890}',
+            '{"id": -9999999999999999999}',
+            '{"text": "\\ud800"}',
+        ):
+            with self.subTest(arguments=arguments):
+                self.assertEqual(_parse_arguments(arguments), json.loads(arguments))
+    
+    def test_invalid_json_raises(self):
+        with self.assertRaises(json.JSONDecodeError):
+            _parse_arguments('{"path": ')
+
+
+if __name__ == "__main__":
+    unittest.main()
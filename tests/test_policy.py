@@ -0,0 +1,167 @@
+"""Tests for the policy engine."""
+
+import os
+import tempfile
+import unittest
+
+from agentbox.policy import Policy
+
+
+class ReadFilePolicyTest(unittest.TestCase):
+    
+    def test_allow_paths_globs(self):
+        policy = Policy({"tools": {"read_file": {"allow_paths": ["/data/*.txt", "./docs/**/*.md"]}}})
+        cases = [
+            ("/data/a.txt", True),
+            ("/data/../data/a.txt", True),
+            ("/data/a.csv", False),
+            ("/etc/passwd", False),
+            ("/data/../etc/passwd", False),
+            ("docs/guide/intro.md", True),
+            ("docs/guide/intro.txt", False),
+            ("", False),
+        ]
+        for path, allowed in cases:
+            with self.subTest(path=path):
+                self.assertEqual(policy.validate("read_file", {"path": path}).allowed, allowed)
+    
+    def test_double_star_allows_any_path(self):
+        for pattern in ("**", "./**"):
+            with self.subTest(pattern=pattern):
+                policy = Policy({"tools": {"read_file": {"allow_paths": [pattern]}}})
+                self.assertTrue(policy.validate("read_file", {"path": "/etc/passwd"}).allowed)
+                self.assertFalse(policy.validate("read_file", {}).allowed)
+    
+    def test_unlisted_tool_is_denied(self):
+        policy = Policy({"tools": {"read_file": {"allow_paths": ["**"]}}})
+        decision = policy.validate("web_request", {"url": "https://example.com", "method": "GET"})
+        self.assertFalse(decision.allowed)
+        self.assertIn("default deny", decision.reason)
+
+
+class WebRequestPolicyTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.policy = Policy({"tools": {"web_request": {
+            "allow_domains": ["example.com"],
+            "allow_methods": ["GET"],
+        }}})
+    
+    def _allowed(self, url, method="GET"):
+        return self.policy.validate("web_request", {"url": url, "method": method}).allowed
+    
+    def test_domains(self):
+        cases = [
+            ("https://example.com/", True),
+            ("https://example.com:8443/path", True),
+            ("https://api.example.com/", True),
+            ("https://a.b.example.com/", True),
+            ("https://EXAMPLE.com/", True),
+            ("https://Api.Example.COM/", True),
+            ("https://evil-example.com/", False),
+            ("https://notexample.com/", False),
+            ("https://example.com.evil.org/", False),
+            ("https://example.org/", False),
+            ("not a url", False),
+        ]
+        for url, allowed in cases:
+            with self.subTest(url=url):
+                self.assertEqual(self._allowed(url), allowed)
+    
+    def test_wildcard_domain(self):
+        policy = Policy({"tools": {"web_request": {"allow_domains": ["*"], "allow_methods": ["GET"]}}})
+        self.assertTrue(policy.validate("web_request", {"url": "https://anything.test/", "method": "GET"}).allowed)
+    
+    def test_method_allowlist(self):
+        self.assertTrue(self._allowed("https://example.com/", "get"))
+        decision = self.policy.validate("web_request", {"url": "https://example.com/", "method": "POST"})
+        self.assertFalse(decision.allowed)
+        self.assertIn("allow_methods", decision.reason)
+
+
+class DecisionCacheTest(unittest.TestCase):
+    
+    def test_cached_decisions_match_uncached(self):
+        policy = Policy({"tools": {
+            "read_file": {"allow_paths": ["/data/*.txt"]},
+            "web_request": {"allow_domains": ["example.com"], "allow_methods": ["GET"]},
+        }})
+        calls = [
+            ("read_file", {"path": "/data/a.txt"}),
+            ("read_file", {"path": "/etc/passwd"}),
+            ("web_request", {"url": "https://api.example.com/", "method": "GET"}),
+            ("web_request", {"url": "https://evil-example.com/", "method": "GET"}),
+            ("unknown", {}),
+        ]
+        for tool_name, args in calls:
+            with self.subTest(tool_name=tool_name, args=args):
+                key = (tool_name, repr(sorted(args.items())))
+                expected = policy.validate(tool_name, args)
+                self.assertEqual(policy.validate(tool_name, args, cache_key=key), expected)
+                # Second lookup is served from the cache
+                self.assertIn(key, policy._decision_cache)
+                self.assertEqual(policy.validate(tool_name, args, cache_key=key), expected)
+        
+        self.assertEqual(
+            policy.validate_batch(calls, cache_keys=[(n, repr(sorted(a.items()))) for n, a in calls]),
+            [policy.validate(n, a) for n, a in calls]
+        )
+    
+    def test_rules_cannot_change_under_cached_decisions(self):
+        data = {"tools": {"read_file": {"allow_paths": ["/data/*.txt"]}}}
+        policy = Policy(data)
+        key = ("read_file", "/data/a.txt")
+        self.assertTrue(policy.validate("read_file", {"path": "/data/a.txt"}, cache_key=key).allowed)
+        
+        with self.assertRaises(TypeError):
+            del policy.tools["read_file"]
+        with self.assertRaises(TypeError):
+            policy.tools["read_file"]["allow_paths"] = ["**"]
+        with self.assertRaises(AttributeError):
+            policy.tools["read_file"]["allow_paths"].append("**")
+        
+        # Changing the source data afterwards doesn't reach the policy either
+        del data["tools"]["read_file"]
+        self.assertIn("read_file", policy.tools)
+        self.assertTrue(policy.validate("read_file", {"path": "/data/a.txt"}).allowed)
+
+
+class PolicyLoadTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "policy.yaml")
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def _write(self, text, mtime_ns):
+        with open(self.path, "w") as f:
+            f.write(text)
+        os.utime(self.path, ns=(mtime_ns, mtime_ns))
+    
+    def test_reload_when_size_changes(self):
+        self._write("limits:\n  max_tool_calls: 5\n", 1_000_000_000)
+        self.assertEqual(Policy.load(self.path).max_tool_calls, 5)
+        
+        self._write("limits:\n  max_tool_calls: 50\n", 1_000_000_000)
+        self.assertEqual(Policy.load(self.path).max_tool_calls, 50)
+    
+    def test_reload_when_mtime_changes(self):
+        self._write("limits:\n  max_tool_calls: 5\n", 1_000_000_000)
+        self.assertEqual(Policy.load(self.path).max_tool_calls, 5)
+        
+        # Same size, so only the mtime tells the two versions apart
+        self._write("limits:\n  max_tool_calls: 7\n", 2_000_000_000)
+        self.assertEqual(Policy.load(self.path).max_tool_calls, 7)
+    
+    def test_cached_policy_is_read_only(self):
+        self._write("tools:\n  read_file:\n    allow_paths: ['/data/*']\n", 1_000_000_000)
+        first = Policy.load(self.path)
+        with self.assertRaises(AttributeError):
+            first.tools["read_file"]["allow_paths"].append("**")
+        self.assertEqual(Policy.load(self.path).tools["read_file"]["allow_paths"], ("/data/*",))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,193 @@
+"""Tests for the agent runtime loop."""
+
+import json
+import os
+import tempfile
+import unittest
+
+from agentbox.logger import AuditLogger
+from agentbox.model import BaseModelClient, ToolInvocation
+from agentbox.policy import Policy
+from agentbox.runtime import AgentRuntime
+from agentbox.tools import ReadFileTool
+
+
+class ScriptedClient(BaseModelClient):
+    """Returns canned responses in order and records the messages sent on each call."""
+    
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent = []
+    
+    def chat(self, messages, tools=None, **kwargs):
+        self.sent.append(list(messages))
+        return self.responses.pop(0)
+
+
+class ContextWindowTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.paths = []
+        for i in range(45):
+            path = os.path.join(self.tmpdir.name, f"f{i}.txt")
+            with open(path, "w") as f:
+                f.write(str(i))
+            self.paths.append(path)
+        self.policy = Policy({
+            "tools": {"read_file": {"allow_paths": [os.path.join(self.tmpdir.name, "*.txt")]}},
+        })
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_turn_with_more_tool_calls_than_window_is_sent_whole(self):
+        calls = [ToolInvocation("read_file", {"path": p}, f"c{i}") for i, p in enumerate(self.paths)]
+        client = ScriptedClient([(None, calls), ("done", [])])
+        runtime = AgentRuntime(client, [ReadFileTool()], self.policy, max_context_messages=40)
+        try:
+            result = runtime.run([{"role": "user", "content": "read them all"}])
+        finally:
+            runtime.close()
+        
+        self.assertEqual(result, "done")
+        roles = [m["role"] for m in client.sent[1]]
+        self.assertEqual(roles, ["user", "assistant"] + ["tool"] * 45)
+    
+    def test_window_never_starts_on_tool_result(self):
+        # A limit of 4 cuts into the last turn's tool results, one past its assistant message
+        runtime = AgentRuntime(ScriptedClient([]), [ReadFileTool()], self.policy, max_context_messages=4)
+        try:
+            messages = [{"role": "user", "content": "go"}]
+            for turn in range(3):
+                messages.append({"role": "assistant", "content": None, "tool_calls": []})
+                messages.extend({"role": "tool", "content": str(i)} for i in range(3))
+            window = runtime._context_window(messages)
+        finally:
+            runtime.close()
+        
+        self.assertEqual([m["role"] for m in window], ["user", "assistant", "tool", "tool", "tool"])
+    
+    def test_window_too_small_for_first_message_is_rejected(self):
+        with self.assertRaises(ValueError):
+            AgentRuntime(ScriptedClient([]), [], self.policy, max_context_messages=1)
+        with self.assertRaises(ValueError):
+            AgentRuntime(ScriptedClient([]), [], self.policy, max_context_messages=0, preserve_first_message=False)
+
+
+class ToolResultReuseTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "data.txt")
+        self.policy = Policy({
+            "tools": {"read_file": {"allow_paths": [os.path.join(self.tmpdir.name, "*.txt")]}},
+        })
+        self.log_path = os.path.join(self.tmpdir.name, "audit.jsonl")
+        self.logger = AuditLogger(self.log_path)
+    
+    def tearDown(self):
+        self.logger.close()
+        self.tmpdir.cleanup()
+    
+    def _run(self, responses):
+        client = ScriptedClient(responses)
+        runtime = AgentRuntime(client, [ReadFileTool()], self.policy, logger=self.logger)
+        try:
+            runtime.run([{"role": "user", "content": "go"}])
+        finally:
+            runtime.close()
+        self.logger.flush()
+        with open(self.log_path) as f:
+            return client, [json.loads(line) for line in f]
+    
+    def test_reused_results_are_audited(self):
+        with open(self.path, "w") as f:
+            f.write("hello")
+        read = lambda call_id: ToolInvocation("read_file", {"path": self.path}, call_id)
+        _, events = self._run([
+            (None, [read("c1"), read("c2")]),
+            (None, [read("c3")]),
+            ("done", []),
+        ])
+        
+        self.assertEqual(
+            [(e["event_type"], e["call_id"], e.get("cached", False)) for e in events],
+            [
+                ("tool_validation", "c1", False),
+                ("tool_result", "c1", False),
+                ("tool_result", "c2", True),
+                ("tool_result", "c3", True),
+            ]
+        )
+        self.assertTrue(all(e["success"] for e in events[1:]))
+    
+    def test_failed_results_are_not_reused(self):
+        read = lambda call_id: ToolInvocation("read_file", {"path": self.path}, call_id)
+        
+        class CreateAfterFirstTurn(ScriptedClient):
+            def chat(inner, messages, tools=None, **kwargs):
+                if len(inner.sent) == 1:
+                    with open(self.path, "w") as f:
+                        f.write("hello")
+                return super().chat(messages, tools=tools, **kwargs)
+        
+        client = CreateAfterFirstTurn([(None, [read("c1")]), (None, [read("c2")]), ("done", [])])
+        runtime = AgentRuntime(client, [ReadFileTool()], self.policy)
+        try:
+            runtime.run([{"role": "user", "content": "go"}])
+        finally:
+            runtime.close()
+        
+        tool_messages = [m for m in client.sent[2] if m["role"] == "tool"]
+        self.assertIn("File not found", tool_messages[0]["content"])
+        self.assertEqual(tool_messages[1]["content"], "hello")
+    
+    def test_identical_non_idempotent_calls_each_execute(self):
+        with open(self.path, "w") as f:
+            f.write("hello")
+        executed = []
+        
+        class CountingReadFileTool(ReadFileTool):
+            idempotent = False
+            
+            def execute(inner, args):
+                executed.append(args)
+                return super().execute(args)
+        
+        read = lambda call_id: ToolInvocation("read_file", {"path": self.path}, call_id)
+        client = ScriptedClient([(None, [read("c1"), read("c2")]), ("done", [])])
+        runtime = AgentRuntime(client, [CountingReadFileTool()], self.policy)
+        try:
+            runtime.run([{"role": "user", "content": "go"}])
+        finally:
+            runtime.close()
+        
+        self.assertEqual(len(executed), 2)
+        tool_messages = [m for m in client.sent[1] if m["role"] == "tool"]
+        self.assertEqual([m["tool_call_id"] for m in tool_messages], ["c1", "c2"])
+
+
+class ToolResultFormatTest(unittest.TestCase):
+    
+    def test_integers_beyond_64_bits_are_serialized(self):
+        runtime = AgentRuntime(ScriptedClient([]), [], Policy({}))
+        try:
+            result = runtime._tool_success_result("c1", "web_request", {"body": {"id": 2 ** 70}})
+        finally:
+            runtime.close()
+        
+        self.assertEqual(json.loads(result["content"]), {"body": {"id": 2 ** 70}})
+    
+    def test_results_are_truncated_by_utf8_bytes(self):
+        runtime = AgentRuntime(ScriptedClient([]), [], Policy({}), max_tool_result_bytes=10)
+        try:
+            result = runtime._tool_success_result("c1", "read_file", "\u00e9" * 8)
+        finally:
+            runtime.close()
+        
+        self.assertEqual(result["content"], "\u00e9" * 5 + "...[truncated 6 bytes]")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+"""Tests for the built-in tools."""
+
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest import mock
+
+from agentbox.tools import ReadFileTool, WebRequestTool
+
+
+class ReadFileToolTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.tool = ReadFileTool()
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def _write(self, data: bytes) -> str:
+        path = os.path.join(self.tmpdir.name, "file.txt")
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+    
+    def test_line_endings_are_normalized(self):
+        path = self._write(b"hello\r\nworld\rend\n")
+        self.assertEqual(self.tool.execute({"path": path}), "hello\nworld\nend\n")
+    
+    def test_truncated_read_is_normalized(self):
+        path = self._write(b"hello\r\nworld\r\n")
+        self.assertEqual(
+            self.tool.execute({"path": path, "max_bytes": 7}),
+            "hello\n\n...[truncated 7 bytes]"
+        )
+    
+    def test_oversized_max_bytes_reads_only_the_file(self):
+        path = self._write(b"hi")
+        self.assertEqual(self.tool.execute({"path": path, "max_bytes": 10**12}), "hi")
+        # Even under a ceiling too large to allocate, only the file's own size is read
+        tool = ReadFileTool(max_bytes=10**15)
+        self.assertEqual(tool.execute({"path": path, "max_bytes": 10**15}), "hi")
+    
+    def test_max_bytes_is_clamped_to_the_tool_limit(self):
+        tool = ReadFileTool(max_bytes=4)
+        path = self._write(b"abcdefgh")
+        self.assertEqual(
+            tool.execute({"path": path, "max_bytes": 10**12}),
+            "abcd\n...[truncated 4 bytes]"
+        )
+        self.assertEqual(tool.execute({"path": path, "max_bytes": 2}), "ab\n...[truncated 6 bytes]")
+
+
+class _BodyHandler(BaseHTTPRequestHandler):
+    """Serves a fixed-size body: plain text at /text, a JSON document at /json."""
+    
+    def do_GET(self):
+        if self.path == "/json":
+            body = b'{"items": [' + b", ".join(b"%d" % i for i in range(1000)) + b"]}"
+            content_type = "application/json"
+        else:
+            body = b"x" * 4096
+            content_type = "text/plain; charset=utf-8"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class WebRequestToolBodyCapTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.server = HTTPServer(("127.0.0.1", 0), _BodyHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.server.server_port}"
+    
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+    
+    def test_body_is_truncated_with_marker(self):
+        tool = WebRequestTool()
+        result = tool.execute({"url": self.base + "/text", "method": "GET", "max_bytes": 100})
+        self.assertEqual(result["body"], "x" * 100 + "\n...[truncated at 100 bytes]")
+    
+    def test_truncated_json_is_left_unparsed(self):
+        tool = WebRequestTool()
+        full = tool.execute({"url": self.base + "/json", "method": "GET"})
+        self.assertEqual(full["body"]["items"][-1], 999)
+        
+        result = tool.execute({"url": self.base + "/json", "method": "GET", "max_bytes": 50})
+        self.assertIsInstance(result["body"], str)
+        self.assertTrue(result["body"].startswith('{"items": [0, 1, 2'))
+        self.assertTrue(result["body"].endswith("\n...[truncated at 50 bytes]"))
+    
+    def test_max_bytes_cannot_exceed_the_tool_limit(self):
+        tool = WebRequestTool(max_bytes=100)
+        for args in ({}, {"max_bytes": 10**12}):
+            with self.subTest(args=args):
+                result = tool.execute({"url": self.base + "/text", "method": "GET", **args})
+                self.assertEqual(result["body"], "x" * 100 + "\n...[truncated at 100 bytes]")
+
+
+class _SessionHandler(BaseHTTPRequestHandler):
+    """Sets a cookie at /login, echoes the Cookie header at /echo, and is always 503 at /down."""
+    
+    def do_GET(self):
+        self.server.hits.append(self.path)
+        status, body, extra = 200, b"", {}
+        if self.path == "/login":
+            extra["Set-Cookie"] = "sid=secret; Path=/"
+        elif self.path == "/echo":
+            body = (self.headers.get("Cookie") or "").encode()
+        elif self.path == "/down":
+            status, body = 503, b"unavailable"
+        self.send_response(status)
+        for name, value in extra.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class WebRequestToolSessionTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.server = HTTPServer(("127.0.0.1", 0), _SessionHandler)
+        self.server.hits = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.server.server_port}"
+    
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+    
+    def test_cookies_are_not_carried_between_calls(self):
+        tool = WebRequestTool()
+        tool.execute({"url": self.base + "/login", "method": "GET"})
+        result = tool.execute({"url": self.base + "/echo", "method": "GET"})
+        self.assertEqual(result["body"], "")
+    
+    def test_last_response_is_returned_after_retries(self):
+        with mock.patch("agentbox.tools.web._RETRY_BACKOFF", 0):
+            tool = WebRequestTool()
+        result = tool.execute({"url": self.base + "/down", "method": "GET"})
+        self.assertEqual(result["status_code"], 503)
+        self.assertEqual(result["body"], "unavailable")
+        self.assertEqual(self.server.hits, ["/down"] * 3)
+
+
+if __name__ == "__main__":
+    unittest.main()